@@ -10,11 +10,14 @@
 # ------------------------------------------
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+import functools
+import operator
 import os
 import sys
-import tempfile
-import shutil
+import socket
+import struct
+from collections import defaultdict, deque
 
 # Nord color palette
 BG_COLOR = "#2E3440"
@@ -26,16 +29,242 @@ ENTRY_FG = "#ECEFF4"
 RESULT_FG = "#EBCB8B"
 ERROR_FG = "#BF616A"
 
+# Search debounce delay and keys that never change the search text
+SEARCH_DEBOUNCE_MS = 120
+NON_EDIT_KEYS = frozenset({
+    "Left", "Right", "Home", "End", "Return", "Tab", "Escape",
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R",
+    "Caps_Lock", "Num_Lock", "Super_L", "Super_R",
+})
+# Most search results rendered into the history listbox
+MAX_SEARCH_RESULTS = 50
+# How long appended history may sit in the write buffer before a flush
+HISTORY_FLUSH_MS = 2000
+# Newest lines of the history file loaded into the search cache at startup
+HISTORY_CACHE_MAX = 10_000
+# Trigram query falls back to a plain scan when its rarest trigram is in
+# more than this share of the cached lines
+TRIGRAM_SCAN_SHARE = 0.1
+# Below this many cached lines a plain scan is fast enough; don't index at all
+TRIGRAM_INDEX_MIN_LINES = 2_000
+# History lines indexed per idle callback while the index is built in the background
+TRIGRAM_INDEX_CHUNK = 250
+# Shown in the search box while it is empty and unfocused
+SEARCH_PLACEHOLDER = "Type to search..."
+
+# (input, output) history labels for each conversion direction
+_LABELS_FWD = ("IP Address", "32-bit Integer")
+_LABELS_REV = ("32-bit Integer", "IP Address")
+# Prefix of the VB code appended to every history entry
+_VB_PREFIX = "🚀 VB-2000"
+
+# Trigrams of the fixed history-entry text (the pieces _convert_units wraps
+# around the values). Nearly every line contains them, so they are neither
+# indexed nor used to pick search candidates.
+_TEMPLATE_TRIGRAMS = frozenset(
+    text[i:i + 3]
+    for in_label, out_label in (_LABELS_FWD, _LABELS_REV)
+    for text in (f"{in_label}: ".lower(), f" → {out_label}: ".lower(),
+                 f" → Error    {_VB_PREFIX}".lower(), f"    {_VB_PREFIX}".lower())
+    for i in range(len(text) - 2)
+)
+
+# Decimal text for every octet value, so formatting never calls str()
+_BYTE_TO_STR = tuple(str(i) for i in range(256))
+
+# Digit value for each byte (255 = not a digit), used by the pure-Python parser
+_DIGIT = bytes(c - 48 if 48 <= c <= 57 else 255 for c in range(256))
+_HAS_INET_PTON = hasattr(socket, "inet_pton")
+
+def _parse_ipv4(ip_address: str) -> int:
+    """ Byte-at-a-time dotted-quad parser: four decimal 0-255 octets, zero
+    padding allowed ("192.168.001.010"). Handles everything inet_pton rejects
+    and says which octet was invalid. """
+    result = acc = digits = dots = 0
+    for c in ip_address.encode("ascii", "replace"):
+        d = _DIGIT[c]
+        if d != 255:
+            acc = acc * 10 + d
+            digits += 1
+            if acc > 255:
+                raise ValueError(f"Invalid IPv4 address format (octet {dots + 1} out of range)")
+        elif c == 46 and digits and dots < 3:  # '.'
+            result = (result << 8) | acc
+            acc = digits = 0
+            dots += 1
+        elif c == 46 and digits:
+            raise ValueError("Invalid IPv4 address format (expected 4 octets)")
+        else:
+            raise ValueError(f"Invalid IPv4 address format (bad octet {dots + 1})")
+    if dots != 3:
+        raise ValueError("Invalid IPv4 address format (expected 4 octets)")
+    if not digits:
+        raise ValueError("Invalid IPv4 address format (bad octet 4)")
+    return (result << 8) | acc
+
+# Both converters are pure, so repeated lookups are served from a per-process
+# LRU cache (kept until exit). Failed conversions raise and are never cached.
+@functools.lru_cache(maxsize=512)
 def ip_to_int(ip_address: str) -> int:
-    parts = ip_address.strip().split('.')
-    if len(parts) != 4 or not all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
-        raise ValueError("Invalid IPv4 address format")
-    return sum(int(part) << (8 * (3 - i)) for i, part in enumerate(parts))
+    ip_address = ip_address.strip()
+    if _HAS_INET_PTON:
+        # inet_pton is strict dotted-quad only (inet_aton would accept "1.2" or "0x7f.1")
+        try:
+            packed = socket.inet_pton(socket.AF_INET, ip_address)
+        except OSError:
+            pass
+        else:
+            return struct.unpack("!I", packed)[0]
+    # Zero-padded octets, or a real error naming the bad octet
+    return _parse_ipv4(ip_address)
 
+@functools.lru_cache(maxsize=512)
 def int_to_ip(int_value: int) -> str:
     if not (0 <= int_value <= 0xFFFFFFFF):
         raise ValueError("Integer out of IPv4 range")
-    return ".".join(str((int_value >> (8 * i)) & 0xFF) for i in reversed(range(4)))
+    b = int_value.to_bytes(4, "big")
+    return f"{_BYTE_TO_STR[b[0]]}.{_BYTE_TO_STR[b[1]]}.{_BYTE_TO_STR[b[2]]}.{_BYTE_TO_STR[b[3]]}"
+
+# --- Batch conversion (scripted use) ---
+# Optional: numpy + numba speed up the batch helpers. They are imported on the
+# first batch call only, so GUI launches (and PyInstaller builds) never load them.
+# Only the batch path is JIT-compiled; for a single address the call overhead
+# of a compiled kernel outweighs the work, so ip_to_int/int_to_ip stay as-is.
+# Kernels use cache=True, but importing numba and loading the cached machine
+# code still costs ~0.7 s per process (a cold compile ~1-2.5 s) against a saving
+# of only ~0.4 us per address. So the scalar loop handles batches below
+# BATCH_JIT_MIN until the kernels have been loaded for a big batch.
+BATCH_JIT_MIN = 2_000_000
+_batch_kernels = None  # None = not tried yet, False = numba unavailable
+
+def _batch_kernels_for(count):
+    if _batch_kernels is None and count < BATCH_JIT_MIN:
+        return False
+    return _load_batch_kernels()
+
+def _load_batch_kernels():
+    global _batch_kernels
+    if _batch_kernels is not None:
+        return _batch_kernels
+    try:
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:
+        _batch_kernels = False
+        return _batch_kernels
+
+    @njit(parallel=True, cache=True)
+    def parse_ipv4(buf, starts, ends, out, ok):
+        # Same rules as _parse_ipv4: four 0-255 octets, zero padding allowed
+        for i in prange(starts.shape[0]):
+            value = 0
+            octet = 0
+            digits = 0
+            dots = 0
+            good = True
+            for j in range(starts[i], ends[i]):
+                c = buf[j]
+                if c == 46:  # '.'
+                    if digits == 0 or dots == 3:
+                        good = False
+                        break
+                    value = (value << 8) | octet
+                    octet = 0
+                    digits = 0
+                    dots += 1
+                elif 48 <= c <= 57:  # '0'-'9'
+                    octet = octet * 10 + (c - 48)
+                    digits += 1
+                    if octet > 255:
+                        good = False
+                        break
+                else:
+                    good = False
+                    break
+            if good and dots == 3 and digits > 0:
+                out[i] = (value << 8) | octet
+                ok[i] = True
+            else:
+                ok[i] = False
+
+    @njit(parallel=True, cache=True)
+    def ipv4_text_lengths(values, lengths):
+        for i in prange(values.shape[0]):
+            v = np.int64(values[i])
+            n = 4  # three dots + trailing newline
+            for k in range(4):
+                o = (v >> (24 - 8 * k)) & 0xFF
+                n += 1 if o < 10 else (2 if o < 100 else 3)
+            lengths[i] = n
+
+    @njit(parallel=True, cache=True)
+    def format_ipv4(values, offsets, buf):
+        for i in prange(values.shape[0]):
+            v = np.int64(values[i])
+            pos = offsets[i]
+            for k in range(4):
+                o = (v >> (24 - 8 * k)) & 0xFF
+                if o >= 100:
+                    buf[pos] = 48 + o // 100
+                    pos += 1
+                if o >= 10:
+                    buf[pos] = 48 + (o // 10) % 10
+                    pos += 1
+                buf[pos] = 48 + o % 10
+                buf[pos + 1] = 46 if k < 3 else 10  # '.' or '\n'
+                pos += 2
+
+    _batch_kernels = (np, parse_ipv4, ipv4_text_lengths, format_ipv4)
+    return _batch_kernels
+
+def ip_to_int_batch(ip_addresses):
+    """ Convert many IPv4 strings at once. Returns a list of ints; raises
+    ValueError naming the index of the first invalid address. """
+    ip_addresses = list(ip_addresses)
+    kernels = _batch_kernels_for(len(ip_addresses))
+    if not kernels:
+        out = []
+        for i, ip in enumerate(ip_addresses):
+            try:
+                out.append(ip_to_int(ip))
+            except ValueError:
+                raise ValueError(f"Invalid IPv4 address format at index {i}") from None
+        return out
+    np, parse_ipv4, _, _ = kernels
+    encoded = [ip.strip().encode("ascii", "replace") for ip in ip_addresses]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    out = np.empty(len(encoded), dtype=np.uint32)
+    ok = np.empty(len(encoded), dtype=np.bool_)
+    parse_ipv4(buf, starts, ends, out, ok)
+    if not ok.all():
+        bad = int(np.argmin(ok))
+        raise ValueError(f"Invalid IPv4 address format at index {bad}")
+    return out.tolist()
+
+def int_to_ip_batch(int_values):
+    """ Convert an iterable of 32-bit integers (Python or numpy ints) to IPv4
+    strings at once. Returns a list of str; raises TypeError for non-integer
+    items (including nested rows) and ValueError for out-of-range values. """
+    # operator.index accepts numpy integer scalars and rejects floats and arrays
+    int_values = [operator.index(v) for v in int_values]
+    if int_values and (min(int_values) < 0 or max(int_values) > 0xFFFFFFFF):
+        raise ValueError("Integer out of IPv4 range")
+    kernels = _batch_kernels_for(len(int_values))
+    if not kernels:
+        return [int_to_ip(v) for v in int_values]
+    if not int_values:
+        return []
+    np, _, ipv4_text_lengths, format_ipv4 = kernels
+    values = np.fromiter(int_values, dtype=np.uint32, count=len(int_values))
+    lengths = np.empty(values.shape[0], dtype=np.int64)
+    ipv4_text_lengths(values, lengths)
+    ends = np.cumsum(lengths)
+    buf = np.empty(int(ends[-1]), dtype=np.uint8)
+    format_ipv4(values, ends - lengths, buf)
+    return buf.tobytes().decode("ascii").split("\n")[:-1]
 
 class ModernUnitConverterApp(tk.Tk):
     HISTORY_FILE = "conversion_history.txt"
@@ -46,8 +275,12 @@ class ModernUnitConverterApp(tk.Tk):
         icon_path = resource_path("thumbnail.ico")
         if hasattr(sys, "_MEIPASS"):
             # Running as PyInstaller EXE: copy to a real temp file
+            import tempfile
             temp_icon = os.path.join(tempfile.gettempdir(), "thumbnail.ico")
-            shutil.copyfile(icon_path, temp_icon)
+            # Reuse a previous launch's copy when it matches the bundled icon's size
+            if not os.path.exists(temp_icon) or os.path.getsize(temp_icon) != os.path.getsize(icon_path):
+                import shutil
+                shutil.copyfile(icon_path, temp_icon)
             self.iconbitmap(temp_icon)
         else:
             # Running as script
@@ -56,15 +289,28 @@ class ModernUnitConverterApp(tk.Tk):
         self.withdraw()
         self.title("GCS Unit Converter")
         self.configure(bg=BG_COLOR)
-        self.history = []
+        self.history = deque(maxlen=10)  # Current session: last 10 entries
+        # Full file history kept in memory so searching never touches the disk
+        self._history_cache = []
+        self._history_cache_lower = []
+        # Trigram -> indices into _history_cache. Built in idle-time chunks after
+        # the first trigram search; only used once all cached lines are indexed.
+        self._trigram_index = None
+        self._trigram_indexed = 0
+        self._index_after_id = None
         self.conv_input_history = []
         self.conv_input_index = None
         self.search_input_history = []
         self.search_input_index = None
+        self._search_after_id = None
+        self._showing_session_history = False
+        self._history_fp = None  # Append handle, opened after the history is loaded
+        self._flush_after_id = None
         self._setup_styles()
         self._create_widgets()
         self._load_history_from_file()
-        self.update_idletasks()
+        self._open_history_file()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.minsize(400, 350)
         self.resizable(False, False)
         self.deiconify()  # Show window
@@ -81,6 +327,9 @@ class ModernUnitConverterApp(tk.Tk):
             foreground=[("active", BG_COLOR)]
         )
         style.configure("Result.TLabel", font=("Segoe UI", 14, "bold"), background=BG_COLOR, foreground=RESULT_FG)
+        # Result/error variants, swapped by style name instead of per-call colour configure
+        style.configure("ResultOK.Result.TLabel", foreground=RESULT_FG)
+        style.configure("ResultErr.Result.TLabel", foreground=ERROR_FG)
         style.configure("NoHover.TCheckbutton", background=BG_COLOR, foreground=ACCENT1, font=("Segoe UI", 10, "bold"))
         style.map("NoHover.TCheckbutton",
                   background=[("selected", BG_COLOR), ("active", BG_COLOR)],
@@ -122,11 +371,8 @@ class ModernUnitConverterApp(tk.Tk):
             relief="flat", highlightthickness=2, highlightbackground=ACCENT1, highlightcolor=ACCENT2
         )
         self.value_entry.grid(row=1, column=1, sticky="ew", pady=6)
-        self.value_entry.bind("<Return>", lambda e: self._convert_units())
+        self.value_entry.bind("<Key>", self._on_value_key)
         self.value_entry.bind("<Enter>", lambda e: self.value_entry.focus_set())
-        self.value_entry.bind("<Up>", self._conv_input_up)
-        self.value_entry.bind("<Down>", self._conv_input_down)
-        self.value_entry.bind("<KeyRelease>", self._conv_input_store)
         self.value_entry.focus_set()
 
         self.convert_btn = ttk.Button(converter_frame, text="Convert", command=self._convert_units)
@@ -137,10 +383,7 @@ class ModernUnitConverterApp(tk.Tk):
         self.conv_result_label = ttk.Label(
             converter_frame,
             text="",
-            style="Result.TLabel",
-            font=("Segoe UI", 14, "bold"),
-            background=BG_COLOR,
-            foreground=RESULT_FG,
+            style="ResultOK.Result.TLabel",
             anchor="w",
             justify="left"
         )
@@ -173,27 +416,24 @@ class ModernUnitConverterApp(tk.Tk):
             font=("Segoe UI", 11)
         )
         self.search_entry.pack(side="left", fill="x", expand=True, ipady=0, pady=6)
-        self.search_entry.insert(0, "Type to search...")
+        self.search_entry.insert(0, SEARCH_PLACEHOLDER)
 
         def on_focus_in(event):
-            if self.search_entry.get() == "Type to search...":
+            if self.search_entry.get() == SEARCH_PLACEHOLDER:
                 self.search_entry.delete(0, tk.END)
                 self.search_entry.config(fg=ENTRY_FG, font=("Segoe UI", 11, "normal"))
             self.search_entry.config(bg="#434C5E", highlightbackground=ACCENT2)
 
         def on_focus_out(event):
             if not self.search_entry.get():
-                self.search_entry.insert(0, "Type to search...")
+                self.search_entry.insert(0, SEARCH_PLACEHOLDER)
                 self.search_entry.config(fg="#aaa", font=("Segoe UI", 11, "italic"))
             self.search_entry.config(bg=ENTRY_BG, highlightbackground=ACCENT1)
 
         self.search_entry.bind("<FocusIn>", on_focus_in)
         self.search_entry.bind("<FocusOut>", on_focus_out)
-        self.search_entry.bind("<KeyRelease>", self._search_history)
+        self.search_entry.bind("<Key>", self._on_search_key)
         self.search_entry.bind("<Enter>", lambda e: self.search_entry.focus_set())
-        self.search_entry.bind("<Up>", self._search_input_up)
-        self.search_entry.bind("<Down>", self._search_input_down)
-        self.search_entry.bind("<Return>", self._search_input_store)
 
         self.history_listbox = tk.Listbox(
             self,
@@ -209,48 +449,156 @@ class ModernUnitConverterApp(tk.Tk):
         self.history_listbox.pack(padx=20, fill="x", pady=(0, 10))
 
     # --- Conversion logic and history ---
+    def _schedule_search(self, event):
+        # Coalesce bursts of typing into a single search pass
+        if event.keysym in NON_EDIT_KEYS:
+            return
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._search_history)
+
     def _search_history(self, event=None):
-        query = self.search_var.get().lower()
+        if self._search_after_id is not None:
+            # Drop any pending debounced search; this pass supersedes it
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        query = self.search_var.get()
+        # The unfocused search box holds placeholder text, not a query
+        query = "" if query == SEARCH_PLACEHOLDER else query.lower()
+        self._showing_session_history = not query
         if query:
-            # Search the file for all history
-            if os.path.exists(self.HISTORY_FILE):
-                try:
-                    with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
-                        all_lines = [line.strip() for line in f.readlines()]
-                except Exception:
-                    all_lines = []
-            else:
-                all_lines = []
-            filtered = [line for line in all_lines if query in line.lower()]
+            # Search all history (file + this session) from the in-memory cache
+            filtered = [self._history_cache[i] for i in self._find_history_matches(query)]
         else:
             # Show only current session history (last 10)
-            filtered = self.history[-10:]
+            filtered = list(self.history)
 
+        # Newest first, capped so Tk work doesn't grow with the history size
+        items = filtered[:-MAX_SEARCH_RESULTS - 1:-1]
+        hidden = len(filtered) - len(items)
+        if hidden:
+            items.append(f"...{hidden} more")
         self.history_listbox.delete(0, tk.END)
-        for item in reversed(filtered):
-            self.history_listbox.insert(tk.END, item)
+        if items:
+            self.history_listbox.insert(tk.END, *items)
+
+    def _find_history_matches(self, query):
+        lower_lines = self._history_cache_lower
+        grams = {query[i:i + 3] for i in range(len(query) - 2)} - _TEMPLATE_TRIGRAMS
+        if not grams:
+            # Too short, or only template text: plain scan
+            return [i for i, lower in enumerate(lower_lines) if query in lower]
+        if self._trigram_index is None or self._trigram_indexed != len(lower_lines):
+            # Index missing or still building: answer with a plain scan meanwhile
+            if self._trigram_index is None and len(lower_lines) >= TRIGRAM_INDEX_MIN_LINES:
+                self._trigram_index = defaultdict(set)
+                self._index_after_id = self.after_idle(self._build_trigram_index_chunk)
+            return [i for i, lower in enumerate(lower_lines) if query in lower]
+        postings = []
+        for gram in grams:
+            indices = self._trigram_index.get(gram)
+            if not indices:
+                return []
+            postings.append(indices)
+        postings.sort(key=len)
+        if len(postings[0]) > len(lower_lines) * TRIGRAM_SCAN_SHARE:
+            # Not selective enough to beat a plain scan
+            return [i for i, lower in enumerate(lower_lines) if query in lower]
+        # Intersect from the rarest trigram; & only walks the smaller set
+        candidates = postings[0]
+        for indices in postings[1:]:
+            candidates = candidates & indices
+            if not candidates:
+                return []
+        # Trigrams only narrow the set; confirm the full substring
+        return [i for i in sorted(candidates) if query in lower_lines[i]]
+
+    def _build_trigram_index_chunk(self):
+        # Index a slice of the cache, then yield to Tk so typing stays responsive
+        lower_lines = self._history_cache_lower
+        start = self._trigram_indexed
+        end = min(start + TRIGRAM_INDEX_CHUNK, len(lower_lines))
+        for index in range(start, end):
+            self._index_history_line(index, lower_lines[index])
+        self._trigram_indexed = end
+        if end < len(lower_lines):
+            self._index_after_id = self.after_idle(self._build_trigram_index_chunk)
+        else:
+            self._index_after_id = None
+
+    def _index_history_line(self, index, lower):
+        trigram_index = self._trigram_index
+        for gram in {lower[i:i + 3] for i in range(len(lower) - 2)} - _TEMPLATE_TRIGRAMS:
+            trigram_index[gram].add(index)
 
     def _add_history(self, entry):
-        self.history.append(entry)
-        if len(self.history) > 10:
-            self.history.pop(0)
+        self.history.append(entry)  # deque drops the oldest past 10
         self._append_history_to_file(entry)
+        # Listbox already lists this session's history: just prepend the new entry
+        incremental = self._showing_session_history and self._search_after_id is None
         self.search_var.set("")  # Clear search box after each calculation
-        self._search_history()
+        if incremental:
+            self.history_listbox.insert(0, entry)
+            if self.history_listbox.size() > 10:
+                self.history_listbox.delete(10, tk.END)
+        else:
+            self._search_history()
 
     def _append_history_to_file(self, entry):
+        lower = entry.lower()
+        if self._trigram_index is not None and self._trigram_indexed == len(self._history_cache):
+            # Index is complete: keep it so (a running build reaches new lines itself)
+            self._index_history_line(self._trigram_indexed, lower)
+            self._trigram_indexed += 1
+        self._history_cache.append(entry)
+        self._history_cache_lower.append(lower)
+        if self._history_fp is None:
+            return
         try:
-            with open(self.HISTORY_FILE, "a", encoding="utf-8") as f:
-                f.write(entry + "\n")
+            self._history_fp.write(entry + "\n")
         except Exception:
-            pass
+            return
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after(HISTORY_FLUSH_MS, self._flush_history_file)
+
+    def _open_history_file(self):
+        # Kept open for the app's lifetime; closed in _on_close
+        try:
+            self._history_fp = open(self.HISTORY_FILE, "a", encoding="utf-8", buffering=8192)
+        except Exception:
+            self._history_fp = None
+
+    def _flush_history_file(self):
+        self._flush_after_id = None
+        if self._history_fp is not None:
+            try:
+                self._history_fp.flush()
+            except Exception:
+                pass
+
+    def _on_close(self):
+        if self._index_after_id is not None:
+            self.after_cancel(self._index_after_id)
+            self._index_after_id = None
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        if self._history_fp is not None:
+            try:
+                self._history_fp.close()
+            except Exception:
+                pass
+            self._history_fp = None
+        self.destroy()
 
     def _load_history_from_file(self):
         if os.path.exists(self.HISTORY_FILE):
             try:
                 with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                self.history = [line.strip() for line in lines[-10:]]
+                    # deque streams the file and keeps only the tail in memory
+                    self._history_cache = [line.rstrip("\n") for line in deque(f, maxlen=HISTORY_CACHE_MAX)]
+                self._history_cache_lower = [line.lower() for line in self._history_cache]
+                self.history.extend(self._history_cache[-10:])
                 self._search_history()
             except Exception:
                 pass
@@ -269,26 +617,20 @@ class ModernUnitConverterApp(tk.Tk):
     def _convert_units(self):
         reverse = self.reverse_var.get()
         value_str = self.value_entry.get().strip()
+        input_label, output_label = _LABELS_REV if reverse else _LABELS_FWD
         try:
             if reverse:
                 value = int(value_str)
-                result = int_to_ip(value)
-                display = str(result)
-                input_label = "32-bit Integer"
-                output_label = "IP Address"
-                # Extract third octet from result IP
-                third_octet = result.split(".")[2] if len(result.split(".")) == 4 else "??"
+                display = int_to_ip(value)
+                # Third octet comes straight from the integer, no splitting of text
+                third_octet = _BYTE_TO_STR[(value >> 8) & 0xFF]
             else:
-                value = value_str
-                result = ip_to_int(value)
-                display = str(result)
-                input_label = "IP Address"
-                output_label = "32-bit Integer"
-                # Extract third octet from input IP
-                third_octet = value.split(".")[2] if len(value.split(".")) == 4 else "??"
-            vb_code = f"🚀 VB-2000{third_octet}"
-            history_entry = f"{input_label}: {value_str} → {output_label}: {display}    {vb_code}"
-            self.conv_result_label.config(text=display, foreground=RESULT_FG)
+                value = ip_to_int(value_str)
+                display = str(value)
+                # VB code keeps the octet as typed, e.g. "001"
+                third_octet = value_str.split(".")[2]
+            history_entry = f"{input_label}: {value_str} → {output_label}: {display}    {_VB_PREFIX}{third_octet}"
+            self.conv_result_label.config(text=display, style="ResultOK.Result.TLabel")
             self._add_history(history_entry)
         except Exception:
             if reverse:
@@ -297,23 +639,34 @@ class ModernUnitConverterApp(tk.Tk):
                 msg = "Enter a valid IPv4 address."
             self.conv_result_label.config(
                 text=msg,
-                foreground=ERROR_FG
+                style="ResultErr.Result.TLabel"
             )
             # Still try to extract third octet for error entry
             try:
                 if reverse:
-                    result_ip = int_to_ip(int(value_str))
-                    third_octet = result_ip.split(".")[2] if len(result_ip.split(".")) == 4 else "??"
+                    value = int(value_str)
+                    third_octet = _BYTE_TO_STR[(value >> 8) & 0xFF] if 0 <= value <= 0xFFFFFFFF else "??"
                 else:
-                    third_octet = value_str.split(".")[2] if len(value_str.split(".")) == 4 else "??"
+                    parts = value_str.split(".")
+                    third_octet = parts[2] if len(parts) == 4 else "??"
             except Exception:
                 third_octet = "??"
-            vb_code = f"🚀 VB-2000{third_octet}"
-            error_entry = f"{input_label}: {value_str} → Error    {vb_code}"
+            error_entry = f"{input_label}: {value_str} → Error    {_VB_PREFIX}{third_octet}"
             self._add_history(error_entry)
         self.value_entry.focus_set()
 
     # --- Conversion input history handlers ---
+    def _on_value_key(self, event):
+        # Single <Key> binding for the conversion input, dispatched on keysym
+        key = event.keysym
+        if key == "Up":
+            return self._conv_input_up(event)
+        if key == "Down":
+            return self._conv_input_down(event)
+        if key == "Return":
+            self._convert_units()
+            self._conv_input_store(event)
+
     def _conv_input_store(self, event):
         if event.keysym == "Return":
             value = self.value_entry.get().strip()
@@ -347,6 +700,21 @@ class ModernUnitConverterApp(tk.Tk):
         return "break"
 
     # --- Search input history handlers ---
+    def _on_search_key(self, event):
+        # Single <Key> binding for the search box; the debounced search runs
+        # after Tk's own Entry binding has applied the keystroke
+        key = event.keysym
+        if key == "Return":
+            self._search_input_store(event)
+            return None
+        result = None
+        if key == "Up":
+            result = self._search_input_up(event)
+        elif key == "Down":
+            result = self._search_input_down(event)
+        self._schedule_search(event)
+        return result
+
     def _search_input_store(self, event):
         value = self.search_entry.get().strip()
         if value and (not self.search_input_history or value != self.search_input_history[-1]):